@@ -12,17 +12,28 @@ bl_info = {
 
 # Because Blender has problems with multifile addons all code is in here, sorry :\
 import bpy
-from mathutils import Vector
-from math import sqrt
+import bmesh
+import numpy as np
+from mathutils import Quaternion, Vector
 import math
+import re
+
+# Set to True to print progress messages of the operators to the console
+_DEBUG = False
+
+
+def _log(*args):
+    if _DEBUG:
+        print(*args)
 
 
 class CubeCutOperator(bpy.types.Operator):
-    """First Call spawns a cube that acts as bounds to the scene. Second call cuts all geometry outside the cube from the active object. Select bounds first, object second."""
+    """First Call spawns a cube that acts as bounds to the scene. Second call cuts all geometry outside the cube from the active object. Select bounds first, object second. With all_bounds the active object is cut with all spawned bounds at once."""
     bl_idname = "object.cube_cut"
     bl_label = "Cube Cut Operator"
 
-    first_call = bpy.props.BoolProperty()
+    first_call = bpy.props.BoolProperty(options={'SKIP_SAVE'})
+    all_bounds = bpy.props.BoolProperty(options={'SKIP_SAVE'})
 
     @classmethod
     def poll(cls, context):
@@ -35,33 +46,182 @@ class CubeCutOperator(bpy.types.Operator):
             bpy.ops.mesh.primitive_cube_add()
             cube = bpy.context.active_object
             cube.display_type = "BOUNDS"
-        else:   
-            # Activate boolean modifier
+            # Mark cube as pending bounds for cutting with all bounds
+            cube["cube_cut_bounds"] = True
+            return {'FINISHED'}
+
+        highPoly = context.active_object
+        if self.all_bounds:
+            # Collect all pending bounds cubes of the scene
+            cubes = [o for o in context.scene.objects
+                if o.get("cube_cut_bounds") and o != highPoly]
+            if not cubes:
+                return {'CANCELLED'}
+        else:
             if len(context.selected_objects) != 2: 
                 return {'CANCELLED'}
             
             cube = context.selected_objects[0]
-            highPoly = context.active_object
             if cube == highPoly: 
                 cube = context.selected_objects[1]
-            
-            boolMod = highPoly.modifiers.new('BoolCut', type='BOOLEAN')
-            boolMod.operation = 'INTERSECT'
-            boolMod.solver = 'FAST'
-            boolMod.object = cube  
-            
-            bpy.ops.object.modifier_apply(modifier="BoolCut")
-            
-            # Delete the bounds cube object
-            bpy.ops.object.select_all(action='DESELECT')
-            cube.select_set(True)
-            #bpy.context.view_layer.objects.active = cube
-            bpy.ops.object.delete(use_global=False)
+            cubes = [cube]
+
+        # Only keep the side planes that have vertices outside of them. Bisecting creates
+        # vertices between existing ones, so earlier cuts cannot add vertices outside a plane
+        vertices = highPoly.data.vertices
+        coords = np.empty(len(vertices) * 3, dtype=np.float32)
+        vertices.foreach_get("co", coords)
+        coords = coords.reshape(-1, 3)
+        planes = []
+        for cube in cubes:
+            for co, no in self.boundsPlanes(highPoly, cube):
+                # A vertex is outside if coords . no > co . no. A float32 normal avoids
+                # upcasting the coordinates into a temporary copy
+                if np.any(coords @ np.array(no, dtype=np.float32) > co.dot(no)):
+                    planes.append((co, no))
+        _log("Cutting with " + str(len(planes)) + " planes.")
+
+        # Cut object with the bounds cubes. All cuts share a single bmesh
+        # instead of applying a boolean modifier per cube
+        if planes:
+            bm = bmesh.new()
+            bm.from_mesh(highPoly.data)
+            for co, no in planes:
+                res = bmesh.ops.bisect_plane(
+                    bm,
+                    geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
+                    plane_co=co,
+                    plane_no=no,
+                    clear_outer=True
+                )
+                # Close the cut like a boolean intersect would. Only closed loops of
+                # boundary edges are filled, so cuts through open scans stay open
+                cutEdges = [e for e in res["geom_cut"] if isinstance(e, bmesh.types.BMEdge)]
+                bmesh.ops.holes_fill(bm, edges=cutEdges, sides=0)
+            bm.to_mesh(highPoly.data)
+            bm.free()
+            highPoly.data.update()
+        
+        # Delete the bounds cube objects
+        for cube in cubes:
+            bpy.data.objects.remove(cube, do_unlink=True)
         return {'FINISHED'}
 
+    # Returns the six side planes (point, outward normal) of the bounds of cube in the local
+    # space of obj. The bounds are convex, so bisecting with each side plane and removing
+    # everything outside keeps the same geometry as intersecting with the bounds
+    def boundsPlanes(self, obj, cube):
+        # Transforms from the local space of the cube into the local space of obj
+        matrix = obj.matrix_world.inverted() @ cube.matrix_world
+        normalMatrix = matrix.inverted().transposed().to_3x3()
+
+        planes = []
+        corners = [Vector(c) for c in cube.bound_box]
+        for axis in range(3):
+            low = min(c[axis] for c in corners)
+            high = max(c[axis] for c in corners)
+            for value, sign in ((high, 1), (low, -1)):
+                co = Vector()
+                co[axis] = value
+                no = Vector()
+                no[axis] = sign
+                planes.append((matrix @ co, (normalMatrix @ no).normalized()))
+        return planes
+
+
+# Creates a new material with an image texture on lowPoly and bakes the albedo of highPoly into it.
+# Deletes materials in low poly. Both objects have to be enabled for rendering
+def _bakeAlbedo(context, highPoly, lowPoly, width, height):
+    name = highPoly.name
+
+    # Remove old materials from the LowPoly Object
+    lowPoly.data.materials.clear()
+    _log("Removed old materials on LowPoly.")
+
+    # Create new material, enable nodes and add to LowPoly object
+    mat = bpy.data.materials.new(name + "_LowPoly_Material")
+    mat.use_nodes = True;
+    lowPoly.data.materials.append(mat)
+    _log("Added new material.")
+
+
+    # Create a new image texture to bake to
+    img = bpy.data.images.new(
+        name= name + "_LowPoly", 
+        width = width, 
+        height = height,  
+        alpha = False, 
+        float_buffer = False, 
+        stereo3d = False, 
+        is_data = False,
+        tiled = False
+    )
+    _log("Created new image node.")
+
+    # Create a new image texture node in the BSDF and assign img
+    # Maybe order the whole tree in some kind (set a position for all nodes)
+    imgTex = mat.node_tree.nodes.new(type="ShaderNodeTexImage")
+    imgTex.image = img
+
+    # The new material only has the default output and Principled BSDF nodes. Find them
+    # through their link instead of by name, because node names are localized
+    output = mat.node_tree.get_output_node('ALL')
+    bsdf = output.inputs['Surface'].links[0].from_node
+
+    # Set the ImageTexture node to be selected and active. The bake uses the active node.
+    # Only the default nodes have to be deselected, new nodes are created selected
+    nodes = mat.node_tree.nodes
+    output.select = False
+    bsdf.select = False
+    imgTex.select = True
+    nodes.active = imgTex
+    _log("Node selected.")
+
+    # Select objects for bake (HighPoly then LowPoly)
+    bpy.ops.object.select_all(action='DESELECT')
+    lowPoly.select_set(True)
+    highPoly.select_set(True)
+    context.view_layer.objects.active = lowPoly
+
+    # Start the baking process
+    _log("Begin baking")
+    bpy.ops.object.bake(
+        type='DIFFUSE', 
+        pass_filter={'COLOR'},
+        use_selected_to_active=True,
+        cage_extrusion=0.1
+    )
+    _log("Bake finished")
+
+    # Use image texture as material base color
+    mat.node_tree.links.new(imgTex.outputs['Color'], bsdf.inputs['Base Color'])
+
+
+# Hides all objects of the view layer except keep from rendering, so that their modifiers
+# are not evaluated during a bake. Appends each hidden object to hidden right away, so that
+# the caller can restore them even if hiding fails partway. Linked objects are read only
+def _hideForBake(context, keep, hidden):
+    for o in context.view_layer.objects:
+        if o in keep or o.library is not None or o.hide_render:
+            continue
+        o.hide_render = True
+        hidden.append(o)
 
-class CustomBakeOperator(bpy.types.Operator):
-    """Bakes a albedo texture from high to low poly in a single step. Deletes materials in low poly."""
+
+# Size of the texture to bake to. Also used for the texture size settings of objects
+def _textureSizeProperty(name):
+    return bpy.props.IntProperty(name=name, min = 1, default=2048)
+
+
+# Texture size properties shared by the bake operators. Mixin properties have to be
+# annotations, Blender does not pick up assigned properties from base classes
+class BakeTextureSizeMixin:
+    textureWidth: _textureSizeProperty("Texture Width")
+    textureHeight: _textureSizeProperty("Texture Height")
+
+
+class CustomBakeOperator(BakeTextureSizeMixin, bpy.types.Operator):
+    """Bakes a albedo texture from high to low poly in a single step. Deletes materials in low poly. The object with fewer vertices is used as low poly."""
     bl_idname = "object.custom_bake"
     bl_label = "Custom Bake Operator"
 
@@ -71,83 +231,106 @@ class CustomBakeOperator(bpy.types.Operator):
             return False
         if len(context.selected_objects) != 2: 
             return False
-        return True
+        return all(o.type == 'MESH' for o in context.selected_objects)
         
     def execute(self, context):
-        highPoly = context.selected_objects[0]
-        lowPoly = context.selected_objects[1]
-        name = highPoly.name
-
-        # Remove old materials from the LowPoly Object
-        for i in range(len(lowPoly.material_slots)):
-            bpy.ops.object.material_slot_remove()
-        print("Removed old materials on LowPoly.")
-
-        # Create new material, enable nodes and add to LowPoly object
-        # mat = bpy.data.materials.new(name + "_LowPoly_Material")  
-        mat = bpy.data.materials.new(name + "_LowPoly_Material")
-        mat.use_nodes = True;
-        lowPoly.data.materials.append(mat)
-        print("Added new material.")
-
-
-        # Create a new image texture to bake to
-        img = bpy.data.images.new(
-            name= name + "_LowPoly", 
-            width = 2048, 
-            height = 2048,  
-            alpha = False, 
-            float_buffer = False, 
-            stereo3d = False, 
-            is_data = False,
-            tiled = False
-        )
-        print("Created new image node.")
-
-        # Create a new image texture node in the BSDF and assign img
-        # Maybe order the whole tree in some kind (set a position for all nodes)
-        imgTex = mat.node_tree.nodes.new(type="ShaderNodeTexImage")
-        imgTex.image = img
-
-        # Selects the given node in a material
-        def selectNode(mat, node):
-            for n in mat.node_tree.nodes:
-                n.select = False
-            node.select = True
-            mat.node_tree.nodes.active = node
-            
-        # Set the ImageTexture node to be selected
-        selectNode(mat, imgTex)
-        print("Node selected.")
+        # The object with fewer vertices is the low poly, independent of selection order
+        a, b = context.selected_objects[0], context.selected_objects[1]
+        if len(a.data.vertices) < len(b.data.vertices):
+            lowPoly, highPoly = a, b
+        else:
+            lowPoly, highPoly = b, a
+
+        hidden = []
+        try:
+            _hideForBake(context, (highPoly, lowPoly), hidden)
+            _bakeAlbedo(context, highPoly, lowPoly, self.textureWidth, self.textureHeight)
+        finally:
+            # Restore render visibility of the other objects
+            for o in hidden:
+                o.hide_render = False
 
-        # Select objects for bake (HighPoly then LowPoly)
-        bpy.ops.object.select_all(action='DESELECT')
-        lowPoly.select_set(True)
-        highPoly.select_set(True)
-        bpy.context.view_layer.objects.active = lowPoly
-
-        # Start the baking process
-        print("Begin baking")
-        bpy.ops.object.bake(
-            type='DIFFUSE', 
-            pass_filter={'COLOR'},
-            use_selected_to_active=True,
-            cage_extrusion=0.1
-        )
-        print("Bake finished")
-
-        # Use image texture as material base color
-        bsdf = mat.node_tree.nodes['Principled BSDF']
-        mat.node_tree.links.new(imgTex.outputs['Color'], bsdf.inputs['Base Color'])
+        return {'FINISHED'}
+
+
+class CustomBakeBatchOperator(BakeTextureSizeMixin, bpy.types.Operator):
+    """Bakes albedo textures for all selected low poly objects in one run. Low poly objects are found by the "_LowPoly" suffix of the low poly operator and baked from the object with the name without suffix."""
+    bl_idname = "object.custom_bake_batch"
+    bl_label = "Custom Batch Bake Operator"
+
+    # Returns the name of the high poly for a low poly name, or None if it has no "_LowPoly" suffix.
+    # Low polys renamed by Blender because of duplicate names (e.g. "_LowPoly.001") are matched too
+    @staticmethod
+    def highPolyName(name):
+        match = re.fullmatch(r"(.+)_LowPoly(\.\d+)?", name)
+        return match.group(1) if match else None
+
+    # Returns (highPoly, lowPoly) pairs for all selected low poly objects. The high poly
+    # has to be in the view layer, because it is selected for the bake
+    @classmethod
+    def findPairs(cls, context):
+        pairs = []
+        for lowPoly in context.selected_objects:
+            name = cls.highPolyName(lowPoly.name)
+            if lowPoly.type != 'MESH' or name is None:
+                continue
+            highPoly = context.view_layer.objects.get(name)
+            if highPoly is not None and highPoly.type == 'MESH':
+                pairs.append((highPoly, lowPoly))
+        return pairs
+
+    @classmethod
+    def poll(cls, context):
+        return len(cls.findPairs(context)) > 0
+
+    def execute(self, context):
+        pairs = self.findPairs(context)
+
+        # Warn about selected objects that are neither a paired low poly nor its high poly
+        paired = {o for pair in pairs for o in pair}
+        for o in context.selected_objects:
+            if o not in paired:
+                name = self.highPolyName(o.name)
+                if name is not None:
+                    self.report({'WARNING'}, "No high poly mesh " + name + " found in the view layer for "
+                        + o.name + ", skipped.")
+                else:
+                    self.report({'WARNING'}, "No low poly/high poly pair found for " + o.name + ", skipped.")
+
+        # Hide everything once and only enable the current pair for each bake
+        baked = 0
+        hidden = []
+        try:
+            _hideForBake(context, (), hidden)
+            for highPoly, lowPoly in pairs:
+                previous = (highPoly.hide_render, lowPoly.hide_render)
+                highPoly.hide_render = False
+                lowPoly.hide_render = False
+                try:
+                    _bakeAlbedo(context, highPoly, lowPoly, self.textureWidth, self.textureHeight)
+                    baked += 1
+                except RuntimeError as e:
+                    # Report and continue, so that one bad pair (e.g. no UVs) does not stop the batch
+                    self.report({'ERROR'}, "Baking " + lowPoly.name + " failed: " + str(e))
+                finally:
+                    highPoly.hide_render, lowPoly.hide_render = previous
+        finally:
+            # Restore render visibility of all objects
+            for o in hidden:
+                o.hide_render = False
+        _log("Baked " + str(baked) + " of " + str(len(pairs)) + " objects.")
 
         return {'FINISHED'}
 
 
 class CustomUVOperator(bpy.types.Operator):
-    """Custom Wrapper for Smart UV Project. Checks if object has more than 40000 vertices because smart uv project might crash"""
+    """Custom Wrapper for Smart UV Project. Checks if object has more than 80000 triangles because smart uv project might crash"""
     bl_idname = "object.custom_uv_project"
     bl_label = "Custom UV Project Wrapper Operator"
 
+    # Maximum number of triangles smart uv project is run on
+    maxTriangles = 80000
+
     @classmethod
     def poll(cls, context):
         return context.active_object is not None
@@ -155,18 +338,26 @@ class CustomUVOperator(bpy.types.Operator):
     def execute(self, context):
         
         lowPoly = bpy.context.active_object
+
+        # Count triangles without triangulating: each polygon with n loops has n-2 triangles
+        polygons = lowPoly.data.polygons
+        loopTotals = np.empty(len(polygons), dtype=np.int32)
+        polygons.foreach_get("loop_total", loopTotals)
+        triangles = int(loopTotals.sum()) - 2 * len(loopTotals)
+
         #UV unwrap the lowPoly mesh
-        if len(lowPoly.data.vertices) < 40000:
-            print("Vertex count < 40000")
+        if triangles < self.maxTriangles:
+            _log("Triangle count " + str(triangles) + " < " + str(self.maxTriangles))
             bpy.ops.object.mode_set(mode='EDIT')
-            print(bpy.ops.mesh.select_all(action='SELECT'))
-            print("Starting uv unwrap")
-            bpy.ops.uv.smart_project()
+            bpy.ops.mesh.select_all(action='SELECT')
+            _log("Starting uv unwrap")
+            # Keep a small margin between islands, so that baked colors do not bleed
+            bpy.ops.uv.smart_project(island_margin=0.01)
             bpy.ops.object.editmode_toggle()
-            print("Finished uv unwrap")
+            _log("Finished uv unwrap")
         else: 
-            print("UV unwrap cancelled because of high polygon count: " 
-            + str(len(lowPoly.data.vertices)) + " > 40000.")
+            self.report({'WARNING'}, "UV unwrap cancelled because of high triangle count: " 
+            + str(triangles) + " >= " + str(self.maxTriangles) + ".")
 
         return {'FINISHED'}
 
@@ -181,7 +372,7 @@ Select vertices or faces in edit mode and exit to object mode before use"""
     @classmethod
     def poll(cls, context):
         if bpy.context.mode != 'OBJECT':
-            print("Error: OrientByNormals Operator can only be executed in object mode")
+            _log("Error: OrientByNormals Operator can only be executed in object mode")
             return False
         return context.active_object is not None
 
@@ -189,21 +380,39 @@ Select vertices or faces in edit mode and exit to object mode before use"""
     def execute(self, context):
         object = context.active_object
         
-        # Addup normals of selected vertices
-        normalAvg = Vector()
-        for v in object.data.vertices:
-            if v.select:
-                print(v.normal)
-                normalAvg += v.normal
-         
-        # Normalize the added normals
-        norm = normalAvg / sqrt(normalAvg.x*normalAvg.x + normalAvg.y*normalAvg.y + normalAvg.z*normalAvg.z) 
+        # Addup normals of selected vertices. foreach_get copies all normals and
+        # selection flags in one call instead of iterating the vertices in python
+        vertices = object.data.vertices
+        n = len(vertices)
+        normals = np.empty(n * 3, dtype=np.float32)
+        sel = np.empty(n, dtype=bool)
+        vertices.foreach_get("normal", normals)
+        vertices.foreach_get("select", sel)
+        summed = normals.reshape(-1, 3)[sel].sum(axis=0)
+
+        if np.linalg.norm(summed) == 0:
+            self.report({'WARNING'}, "No vertices selected or selected normals cancel out")
+            return {'CANCELLED'}
 
         # transform normals to world space. @ is character for matrix vector multiplication in blender 2.8+ 
-        world_normal = object.matrix_world.inverted().transposed().to_3x3() @ norm
-
-        # Compute rotation quaternion between averaged normal and up vector
-        rot = world_normal.rotation_difference(Vector([0, 0, 1]))
+        # inverted_safe avoids an error for a singular world matrix (e.g. zero scale)
+        normalMatrix = object.matrix_world.inverted_safe().transposed().to_3x3()
+
+        # Transform and normalize the added normals in numpy
+        world_normal = np.array(normalMatrix) @ summed
+        world_normal /= np.linalg.norm(world_normal)
+
+        # Compute rotation quaternion between averaged normal and up vector.
+        # For unit vectors a, b it is (1 + a.b, a x b) normalized
+        up = np.array([0.0, 0.0, 1.0])
+        dot = world_normal @ up
+        if dot < -1 + 1e-6:
+            # Normal points downwards, so any half turn around a horizontal axis works
+            rot = Quaternion((0.0, 1.0, 0.0, 0.0))
+        else:
+            s = math.sqrt(2 * (1 + dot))
+            axis = np.cross(world_normal, up) / s
+            rot = Quaternion((s * 0.5, axis[0], axis[1], axis[2]))
 
         # Set object to use quaternions instead of euler for rotation
         object.rotation_mode = 'QUATERNION'
@@ -241,27 +450,36 @@ class LowPolyOperator(bpy.types.Operator):
         highPoly = bpy.context.active_object
         name = highPoly.name 
         
-        bpy.ops.object.duplicate()
-        lowPoly = bpy.context.active_object
+        # Copy object and mesh data directly instead of using the duplicate operator
+        lowPoly = highPoly.copy()
+        lowPoly.data = highPoly.data.copy()
         lowPoly.name = name + "_LowPoly"
-        print("Duplicated HighPoly object.") 
+        for collection in highPoly.users_collection:
+            collection.objects.link(lowPoly)
 
-        #Reduce polygon count with decimate collaps modifier
-        decimate = lowPoly.modifiers.new("Decimate Collaps", 'DECIMATE')
-        decimate.ratio = self.decimateCollapsValue
-        print("Added decimate modifier.")
-        
-        res = bpy.ops.object.modifier_apply(modifier="Decimate Collaps")
-        print("Applied decimate modifier: " + str(res))
+        # Make the copy the only selected and active object for the modifier operators
+        bpy.ops.object.select_all(action='DESELECT')
+        lowPoly.select_set(True)
+        context.view_layer.objects.active = lowPoly
+        _log("Duplicated HighPoly object.") 
 
-        # Reduce details on even planes (good for buildings)
+        # Reduce details on even planes (good for buildings). This runs first,
+        # because it is cheap and shrinks the mesh for the expensive collaps
         planar = lowPoly.modifiers.new("Decimate Planar", 'DECIMATE')
         planar.decimate_type = 'DISSOLVE'
         planar.angle_limit = math.radians(self.decimatePlanarValue)
-        print("Added planar modifier.")
+        _log("Added planar modifier.")
+
+        #Reduce polygon count with decimate collaps modifier
+        decimate = lowPoly.modifiers.new("Decimate Collaps", 'DECIMATE')
+        decimate.ratio = self.decimateCollapsValue
+        _log("Added decimate modifier.")
         
-        res = bpy.ops.object.modifier_apply(modifier="Decimate Planar")
-        print("Applied planar modifier: " + str(res))
+        # Apply both modifiers with a single evaluation of the modifier stack. Modifiers copied
+        # from the HighPoly are applied too, so the low poly matches the surface that is baked.
+        # The low poly is the only selected object, so only it is converted
+        res = bpy.ops.object.convert(target='MESH')
+        _log("Applied decimate modifiers: " + str(res))
 
         return {'FINISHED'}
 
@@ -289,6 +507,9 @@ class PhotogrammetryPanel(bpy.types.Panel):
         
         layout.operator("object.cube_cut", text="Add Cut Bounds").first_call = True
         layout.operator("object.cube_cut", text="Cut Object").first_call = False
+        cut_all_op = layout.operator("object.cube_cut", text="Cut with all Bounds")
+        cut_all_op.first_call = False
+        cut_all_op.all_bounds = True
         
         # Create Low Poly
         layout.label(text="Create Low Poly")
@@ -306,7 +527,19 @@ class PhotogrammetryPanel(bpy.types.Panel):
         layout.operator("object.custom_uv_project", text="Create UVs")
         
         layout.label(text="Bake Textures")
-        layout.operator("object.custom_bake", text="Bake")
+        
+        layout.prop(context.object, "bakeWidth")
+        layout.prop(context.object, "bakeHeight")
+        
+        bake_operator = layout.operator("object.custom_bake", text="Bake")
+        
+        bake_operator.textureWidth = context.object.bakeWidth
+        bake_operator.textureHeight = context.object.bakeHeight
+        
+        batch_operator = layout.operator("object.custom_bake_batch", text="Bake all selected Low Polys")
+        
+        batch_operator.textureWidth = context.object.bakeWidth
+        batch_operator.textureHeight = context.object.bakeHeight
         
         
 
@@ -314,17 +547,21 @@ def register():
     
     bpy.utils.register_class(CubeCutOperator)
     bpy.utils.register_class(CustomBakeOperator)
+    bpy.utils.register_class(CustomBakeBatchOperator)
     bpy.utils.register_class(CustomUVOperator)
     bpy.utils.register_class(OrientByNormalsOperator)
     bpy.utils.register_class(LowPolyOperator)
     bpy.utils.register_class(PhotogrammetryPanel)
     bpy.types.Object.decimateCollaps = bpy.props.FloatProperty(name="Decimate Anteil", min = 0, max = 1, step=4, precision=4, default=0.01)
     bpy.types.Object.decimatePlanar = bpy.props.FloatProperty(name="Planar Angle", min = 0, default=5)
+    bpy.types.Object.bakeWidth = _textureSizeProperty("Texture Width")
+    bpy.types.Object.bakeHeight = _textureSizeProperty("Texture Height")
         
 def unregister(): 
 
     bpy.utils.unregister_class(CubeCutOperator)
     bpy.utils.unregister_class(CustomBakeOperator)
+    bpy.utils.unregister_class(CustomBakeBatchOperator)
     bpy.utils.unregister_class(CustomUVOperator)
     bpy.utils.unregister_class(OrientByNormalsOperator)
     bpy.utils.unregister_class(LowPolyOperator)